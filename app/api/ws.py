@@ -9,6 +9,7 @@ from typing import Any, Dict
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query
 from fastapi.websockets import WebSocketState
 
+from app.core.config import settings
 from app.core.firebase import verify_firebase_token
 from app.models.messages import (
     ClientInitSession,
@@ -27,6 +28,9 @@ router = APIRouter()
 session_store = SessionStore()
 db = RealtimeDB()
 transcriber = Transcriber(model_name=os.getenv("WHISPER_MODEL", "base"))
+live_profile = settings.decoding_profile(settings.LIVE_PROFILE)
+final_profile = settings.decoding_profile(settings.FINAL_PROFILE)
+transcriber.preload(live_profile, final_profile)
 
 
 def utc_now_iso() -> str:
@@ -116,7 +120,7 @@ async def ws_transcribe(
                 # Note: word-level timestamps are not returned to keep it simple and fast.
                 chunk_text = await asyncio.get_event_loop().run_in_executor(
                     None,
-                    lambda: transcriber.transcribe_file(chunk_path, language=session.language),
+                    lambda: transcriber.transcribe_file(chunk_path, language=session.language, profile=live_profile),
                 )
 
                 # Update in-memory stats
@@ -180,7 +184,7 @@ async def ws_transcribe(
                 full_path = session_store.concat_session_audio(session.session_id)
                 full_text = await asyncio.get_event_loop().run_in_executor(
                     None,
-                    lambda: transcriber.transcribe_file(full_path, language=session.language),
+                    lambda: transcriber.transcribe_file(full_path, language=session.language, profile=final_profile),
                 )
 
                 # Persist transcript and final status
@@ -1,9 +1,40 @@
+import json
 import os
 from pathlib import Path
-from pydantic import Field
+from typing import Dict, List, Optional, Union
+
+from pydantic import BaseModel, Field, field_validator
 from pydantic_settings import BaseSettings
 
 
+class DecodingProfile(BaseModel):
+    """
+    Named set of Whisper decoding options.
+    compute_type / cpu_threads / num_workers are model-level (faster-whisper loads one model per combination),
+    the rest are passed to each transcribe call. Profiles with identical model-level settings share one model,
+    so keep them different for live and final if the two paths should not block each other.
+    """
+    compute_type: str = "int8"  # "int8" | "int8_float32" | "float32" ...
+    beam_size: int = 5
+    cpu_threads: int = 0  # 0 = library default
+    num_workers: int = 1
+    temperature: List[float] = Field(default_factory=lambda: [0.0, 0.2, 0.4, 0.6, 0.8, 1.0])
+    vad_filter: bool = True
+    vad_parameters: Optional[Dict[str, Union[int, float]]] = None  # e.g. window_size_samples must stay int
+
+
+def _default_profiles() -> Dict[str, DecodingProfile]:
+    return {
+        # Latency-critical 5s chunks: greedy, no temperature fallback
+        "live": DecodingProfile(compute_type="int8", beam_size=1, temperature=[0.0], vad_filter=True,
+                                vad_parameters={"min_silence_duration_ms": 500}),
+        # Throughput-oriented full pass after stop; num_workers differs from live so it gets its own model
+        # and live chunks never queue behind a long final pass
+        "final": DecodingProfile(compute_type="int8", beam_size=5, num_workers=2, vad_filter=True),
+        # Reference used by autotune to measure accuracy
+        "accurate": DecodingProfile(compute_type="float32", beam_size=5, vad_filter=True),
+    }
+
 
 class Settings(BaseSettings):
     # Firebase
@@ -19,12 +50,44 @@ class Settings(BaseSettings):
     # Storage for temp audio files
     TEMP_DIR: str = Field(default="/tmp/whisper_ws")
 
+    # Max size of a bulk upload (POST /sessions/upload), in bytes
+    MAX_UPLOAD_BYTES: int = Field(default=1024 * 1024 * 1024)
+
     # Whisper model name ("tiny", "base", "small", "medium", "large")
     WHISPER_MODEL: str = Field(default="base")
 
+    # Decoding profiles (JSON object in env: {"name": {...DecodingProfile}}), merged over the defaults
+    DECODING_PROFILES: Dict[str, DecodingProfile] = Field(default_factory=_default_profiles)
+    LIVE_PROFILE: str = Field(default="live", description="Profile used for per-chunk live transcription")
+    FINAL_PROFILE: str = Field(default="final", description="Profile used for the full pass after stop")
+
+    # Autotune: max word error rate vs. the reference profile, and where the winner is written
+    AUTOTUNE_MAX_WER: float = Field(default=0.05)
+    AUTOTUNE_OUTPUT: str = Field(default="decoding_profiles.autotuned.json")
+
     class Config:
         env_file = ".env"
 
+    @field_validator("DECODING_PROFILES", mode="after")
+    @classmethod
+    def _merge_default_profiles(cls, value: Dict[str, DecodingProfile]) -> Dict[str, DecodingProfile]:
+        # Overrides add to / replace individual defaults instead of dropping live/final/accurate
+        return {**_default_profiles(), **value}
+
+    def decoding_profile(self, name: str) -> DecodingProfile:
+        """
+        Resolve a profile by name. Profiles written by the autotune command (AUTOTUNE_OUTPUT)
+        are looked up after the configured ones.
+        """
+        if name in self.DECODING_PROFILES:
+            return self.DECODING_PROFILES[name]
+        tuned_path = Path(self.AUTOTUNE_OUTPUT)
+        if tuned_path.is_file():
+            tuned = json.loads(tuned_path.read_text(encoding="utf-8"))
+            if name in tuned:
+                return DecodingProfile(**tuned[name])
+        raise ValueError(f"Unknown decoding profile: {name}")
+
 
 settings = Settings()
 
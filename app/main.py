@@ -1,9 +1,20 @@
-from fastapi import FastAPI
+import traceback
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from app.api.ws import router as ws_router
+from starlette.requests import ClientDisconnect
+from app.api.ws import router as ws_router, session_store, db, transcriber, final_profile, utc_now_iso
+from app.core.config import settings
+from app.core.firebase import verify_firebase_token
+from app.services.session_store import SessionData, AudioChunkMeta, UploadTooLargeError
 
 app = FastAPI(title="Whisper Realtime WS API", version="0.1.0")
 
+# Bulk imports are transcribed one at a time, outside Starlette's shared threadpool
+upload_queue = ThreadPoolExecutor(max_workers=1, thread_name_prefix="upload-transcribe")
+
 # CORS: adjust allowed origins for RN + web as needed
 app.add_middleware(
     CORSMiddleware,
@@ -19,5 +30,123 @@ def health():
     return {"ok": True}
 
 
+@app.post("/sessions/upload", status_code=202)
+async def upload_recording(
+        request: Request,
+        token: str = Query(..., description="Firebase ID token"),
+        title: str = Query(...),
+        language: str = Query(...),
+        sampleRate: int = Query(16000),
+        source: str = Query("web"),
+):
+    """
+    Bulk upload of an existing recording (raw audio bytes as request body, mime from Content-Type).
+    The body is streamed straight to disk; no per-chunk live transcription is done.
+    A single full-length transcription is queued and progress is reported via session status.
+    """
+    try:
+        uid = verify_firebase_token(token)["uid"]
+    except Exception:
+        raise HTTPException(status_code=401, detail="Unauthorized")
+
+    # Reject oversized uploads up front when the client declares a length
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > settings.MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail=f"Upload exceeds {settings.MAX_UPLOAD_BYTES} bytes")
+
+    session_id = f"sess_{uuid.uuid4().hex[:8]}"
+    created_at = utc_now_iso()
+    mime = request.headers.get("content-type", "audio/wav").split(";")[0].strip()
+
+    session_store.create_session(SessionData(
+        session_id=session_id,
+        uid=uid,
+        title=title,
+        sample_rate=sampleRate,
+        language=language,
+        source=source,
+        created_at=created_at,
+    ))
+    db.create_session(
+        uid=uid,
+        session_id=session_id,
+        payload={
+            "title": title,
+            "sampleRate": sampleRate,
+            "language": language,
+            "source": source,
+            "status": "uploading",
+            "createdAt": created_at,
+            "updatedAt": created_at,
+            "stats": {"chunksCount": 0, "totalDurationSec": 0},
+        },
+    )
+
+    # Stream the body to disk chunk by chunk (never held in memory as a whole)
+    try:
+        file_path = await session_store.save_upload_stream(
+            session_id, mime, request.stream(), max_bytes=settings.MAX_UPLOAD_BYTES
+        )
+    except UploadTooLargeError as e:
+        db.update_status(uid, session_id, "error")
+        raise HTTPException(status_code=413, detail=str(e))
+    except ValueError as e:
+        db.update_status(uid, session_id, "error")
+        raise HTTPException(status_code=400, detail=str(e))
+    except ClientDisconnect:
+        db.update_status(uid, session_id, "error")
+        raise HTTPException(status_code=400, detail="Client disconnected during upload")
+    except Exception:
+        # Server-side failure (disk full, permissions, ...): surfaces as 500
+        db.update_status(uid, session_id, "error")
+        raise
+
+    # Duration is filled in from the decoder once transcription is done
+    session_store.add_chunk_meta(
+        session_id=session_id,
+        meta=AudioChunkMeta(seq=0, offset_ms=0, duration_sec=0.0, file_path=file_path),
+    )
+    db.update_stats(uid=uid, session_id=session_id, chunks_count=1, total_duration_sec=0)
+    # Waits on the single upload worker; _transcribe_upload moves it to "processing"
+    db.update_status(uid, session_id, "queued")
+
+    future = upload_queue.submit(_transcribe_upload, uid, session_id, file_path, language)
+    future.add_done_callback(_report_upload_failure)
+
+    return {"sessionId": session_id, "status": "queued", "createdAt": created_at}
+
+
+def _transcribe_upload(uid: str, session_id: str, file_path: str, language: str):
+    # Runs on the single upload worker; the uploaded file is decoded directly
+    # (no concat/re-encode step) with the final decoding profile.
+    try:
+        db.update_status(uid, session_id, "processing")
+        full_text, duration_sec = transcriber.transcribe_file_with_duration(
+            file_path, language=language, profile=final_profile
+        )
+
+        session_store.add_chunk_meta(
+            session_id=session_id,
+            meta=AudioChunkMeta(seq=0, offset_ms=0, duration_sec=duration_sec, file_path=file_path),
+        )
+        db.update_stats(uid=uid, session_id=session_id, chunks_count=1, total_duration_sec=duration_sec)
+        db.save_full_transcript(uid, session_id, full_text)
+        db.update_status(uid, session_id, "done")
+    except Exception:
+        # Best effort: the status is the only progress signal clients have
+        try:
+            db.update_status(uid, session_id, "error")
+        except Exception:
+            pass
+        raise
+
+
+def _report_upload_failure(future: Future):
+    # Queued futures are never awaited, so print failures instead of dropping them
+    error = future.exception()
+    if error is not None:
+        traceback.print_exception(type(error), error, error.__traceback__)
+
+
 # WebSocket router
 app.include_router(ws_router)
@@ -0,0 +1,152 @@
+# python -m app.services.autotune --wav tests/sample.wav --lang pl --target final
+
+import argparse
+import json
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from app.core.config import DecodingProfile, settings
+from app.services.transcriber import Transcriber
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    """Word-level Levenshtein distance normalized by reference length (case and punctuation ignored)."""
+    ref = re.findall(r"\w+", reference.lower())
+    hyp = re.findall(r"\w+", hypothesis.lower())
+    if not ref:
+        return 0.0 if not hyp else 1.0
+
+    prev = list(range(len(hyp) + 1))
+    for i, r in enumerate(ref, start=1):
+        cur = [i] + [0] * len(hyp)
+        for j, h in enumerate(hyp, start=1):
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (r != h))
+        prev = cur
+    return prev[-1] / len(ref)
+
+
+def grid_candidates(base: DecodingProfile) -> Dict[str, DecodingProfile]:
+    """Small grid around a base profile: compute_type x beam_size x cpu_threads."""
+    cpus = os.cpu_count() or 1
+    threads = sorted({max(1, cpus // 2), cpus})
+    out = {}
+    for compute_type in ("int8", "int8_float32", "float32"):
+        for beam_size in (1, base.beam_size):
+            for cpu_threads in threads:
+                name = f"grid_{compute_type}_b{beam_size}_t{cpu_threads}"
+                out[name] = base.model_copy(update={
+                    "compute_type": compute_type,
+                    "beam_size": beam_size,
+                    "cpu_threads": cpu_threads,
+                })
+    return out
+
+
+def slice_audio(wav_path: str, out_dir: str, chunk_seconds: float = 5.0) -> List[str]:
+    """Split audio into ~5s WAV files, the way live clients send it (see tests/test_ws.py)."""
+    from pydub import AudioSegment  # local import to avoid global dependency issues
+
+    audio = AudioSegment.from_file(wav_path)
+    step = int(chunk_seconds * 1000)
+    paths = []
+    for seq, start in enumerate(range(0, len(audio), step)):
+        path = os.path.join(out_dir, f"{seq:06d}.wav")
+        audio[start:start + step].export(path, format="wav")
+        paths.append(path)
+    return paths
+
+
+def benchmark(
+        model_name: str,
+        inputs: List[str],
+        language: Optional[str],
+        profile: DecodingProfile,
+        runs: int,
+) -> Tuple[float, str]:
+    """
+    Return (best wall time per input in seconds, joined transcript).
+    Uses its own Transcriber so the candidate's model is freed afterwards; a warm-up pass excludes model loading.
+    """
+    transcriber = Transcriber(model_name=model_name)
+    text = " ".join(transcriber.transcribe_file(p, language=language, profile=profile) for p in inputs)
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        for p in inputs:
+            transcriber.transcribe_file(p, language=language, profile=profile)
+        best = min(best, (time.perf_counter() - start) / len(inputs))
+    return best, text
+
+
+def write_profile(output: str, name: str, profile: DecodingProfile):
+    """Merge the winning profile into the autotune output file under the given name."""
+    path = Path(output)
+    existing = json.loads(path.read_text(encoding="utf-8")) if path.is_file() else {}
+    existing[name] = profile.model_dump()
+    path.write_text(json.dumps(existing, indent=2), encoding="utf-8")
+
+
+def run(
+        wav_path: str,
+        language: Optional[str],
+        target: str,
+        reference_name: str,
+        candidate_names: List[str],
+        use_grid: bool,
+        max_wer: float,
+        runs: int,
+        name: str,
+        output: str,
+):
+    # Live candidates are timed on 5s slices (per-chunk latency), final ones on the whole file
+    with tempfile.TemporaryDirectory() as tmp:
+        inputs = slice_audio(wav_path, tmp) if target == "live" else [wav_path]
+
+        reference = settings.decoding_profile(reference_name)
+        _, reference_text = benchmark(settings.WHISPER_MODEL, inputs, language, reference, runs=0)
+
+        candidates = {n: settings.decoding_profile(n) for n in candidate_names}
+        if use_grid:
+            base_name = settings.LIVE_PROFILE if target == "live" else settings.FINAL_PROFILE
+            candidates.update(grid_candidates(settings.decoding_profile(base_name)))
+
+        results = []
+        for cand_name, profile in candidates.items():
+            elapsed, text = benchmark(settings.WHISPER_MODEL, inputs, language, profile, runs=runs)
+            wer = word_error_rate(reference_text, text)
+            results.append((elapsed, wer, cand_name, profile))
+            print(f"{cand_name:<32} {elapsed:8.3f}s/input  WER={wer:.3f}")
+
+    within_budget = sorted((r for r in results if r[1] <= max_wer), key=lambda r: r[0])
+    if not within_budget:
+        raise SystemExit(f"No candidate within WER budget {max_wer:.3f} (reference: {reference_name})")
+
+    elapsed, wer, cand_name, profile = within_budget[0]
+    write_profile(output, name, profile)
+    setting = "LIVE_PROFILE" if target == "live" else "FINAL_PROFILE"
+    print(f"\nFastest within budget: {cand_name} ({elapsed:.3f}s/input, WER={wer:.3f})")
+    print(f"Written as '{name}' to {output}; set {setting}={name} to use it.")
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Benchmark decoding profiles on this host and keep the fastest one")
+    ap.add_argument("--wav", default="tests/sample.wav", help="Audio file to benchmark on")
+    ap.add_argument("--lang", default="pl", help="Language hint for Whisper")
+    ap.add_argument("--target", choices=["live", "final"], default="final",
+                    help="live: time 5s chunks (per-chunk latency); final: time the whole file")
+    ap.add_argument("--reference", default="accurate", help="Profile whose transcript is treated as ground truth")
+    ap.add_argument("--profiles", default=None, help="Comma-separated candidate profiles (default: all configured)")
+    ap.add_argument("--grid", action="store_true", help="Also try a compute_type/beam/threads grid around the target's profile")
+    ap.add_argument("--max-wer", type=float, default=settings.AUTOTUNE_MAX_WER, help="Accuracy budget (WER vs reference)")
+    ap.add_argument("--runs", type=int, default=3, help="Timed runs per candidate (best is kept)")
+    ap.add_argument("--name", default=None, help="Profile name to write the winner under (default: autotuned_<target>)")
+    ap.add_argument("--output", default=settings.AUTOTUNE_OUTPUT, help="JSON file the winner is written to")
+    args = ap.parse_args()
+
+    names = args.profiles.split(",") if args.profiles else [n for n in settings.DECODING_PROFILES if n != args.reference]
+    run(args.wav, args.lang, args.target, args.reference, names, args.grid, args.max_wer, max(1, args.runs),
+        args.name or f"autotuned_{args.target}", args.output)
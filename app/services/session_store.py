@@ -1,12 +1,17 @@
+import asyncio
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
 from threading import RLock
-from typing import Dict, Optional
+from typing import AsyncIterator, Dict, Optional
 
 from app.core.config import settings
 
 
+class UploadTooLargeError(ValueError):
+    """Raised when a streamed upload exceeds the configured size limit."""
+
+
 @dataclass
 class AudioChunkMeta:
     seq: int
@@ -65,6 +70,41 @@ class SessionStore:
             f.write(data)
         return str(path)
 
+    async def save_upload_stream(
+            self,
+            session_id: str,
+            mime: str,
+            stream: AsyncIterator[bytes],
+            max_bytes: int,
+    ) -> str:
+        """
+        Write an uploaded recording to the session dir as it arrives (bounded memory).
+        Raises ValueError on an empty body and UploadTooLargeError above max_bytes;
+        the partial file is removed on any failure.
+        """
+        s = self.get(session_id)
+        ext = self._mime_to_ext(mime)
+        path = s.session_dir / f"upload{ext}"
+        loop = asyncio.get_event_loop()
+        f = await loop.run_in_executor(None, open, path, "wb")
+        try:
+            total = 0
+            async for part in stream:
+                total += len(part)
+                if total > max_bytes:
+                    raise UploadTooLargeError(f"Upload exceeds {max_bytes} bytes")
+                if part:
+                    await loop.run_in_executor(None, f.write, part)
+            if total == 0:
+                raise ValueError("Empty upload")
+        except BaseException:
+            # plain close: awaiting here could be interrupted again if the request was cancelled
+            f.close()
+            path.unlink(missing_ok=True)
+            raise
+        await loop.run_in_executor(None, f.close)
+        return str(path)
+
     def add_chunk_meta(self, session_id: str, meta: AudioChunkMeta):
         with self._lock:
             s = self.get(session_id)
@@ -1,6 +1,9 @@
-from typing import Optional
+from threading import Lock
+from typing import Dict, Optional, Tuple
 import warnings
 
+from app.core.config import DecodingProfile
+
 
 # Prefer faster-whisper if available; otherwise fall back to openai-whisper.
 # Both require ffmpeg installed in the environment.
@@ -8,18 +11,21 @@ class Transcriber:
     """
     Simple wrapper around Whisper to transcribe audio files.
     The implementation prioritizes simplicity and stability over advanced features.
+    Decoding options come from a DecodingProfile; faster-whisper models are cached per
+    (compute_type, cpu_threads, num_workers) so live and final profiles can differ.
     """
 
     def __init__(self, model_name: str = "base"):
         self._backend = None
         self._model_name = model_name
+        self._models: Dict[Tuple[str, int, int], object] = {}
+        self._models_lock = Lock()
         self._init_backend()
 
     def _init_backend(self):
         try:
             from faster_whisper import WhisperModel  # type: ignore
-            # CPU default; adjust compute_type to "int8" or "float32" as needed
-            self._backend = ("faster", WhisperModel(self._model_name, device="cpu", compute_type="int8"))
+            self._backend = ("faster", WhisperModel)
         except Exception:
             try:
                 import whisper  # type: ignore
@@ -29,20 +35,100 @@ class Transcriber:
                     "No Whisper backend available. Install 'faster-whisper' or 'openai-whisper' and ensure ffmpeg is present."
                 ) from e
 
-    def transcribe_file(self, file_path: str, language: Optional[str] = None) -> str:
+    def preload(self, *profiles: DecodingProfile):
+        """
+        Load the models for the given profiles up front so the first request does not pay for it.
+        Falls back to openai-whisper only if faster-whisper cannot load a model with the plain int8 CPU
+        settings used before profiles existed; an invalid profile (e.g. compute_type="float16" on CPU)
+        raises instead of silently switching engines.
+        """
+        if self._backend[0] != "faster":
+            return
+        for profile in profiles:
+            try:
+                self._faster_model(profile)
+            except Exception as profile_error:
+                try:
+                    self._faster_model(DecodingProfile())
+                except Exception as backend_error:
+                    self._fall_back_to_openai(backend_error)
+                    return
+                raise ValueError(f"Cannot load Whisper model for decoding profile {profile!r}") from profile_error
+
+    def _fall_back_to_openai(self, cause: Exception):
+        warnings.warn(f"faster-whisper could not load model '{self._model_name}' ({cause!r}); using openai-whisper")
+        self._models.clear()
+        try:
+            import whisper  # type: ignore
+            self._backend = ("openai", whisper.load_model(self._model_name))
+        except Exception as e:
+            raise RuntimeError(
+                f"faster-whisper failed to load model '{self._model_name}' ({cause!r}) and openai-whisper is unavailable."
+            ) from e
+
+    def _faster_model(self, profile: DecodingProfile):
+        key = (profile.compute_type, profile.cpu_threads, profile.num_workers)
+        with self._models_lock:
+            if key not in self._models:
+                _, whisper_model_cls = self._backend
+                self._models[key] = whisper_model_cls(
+                    self._model_name,
+                    device="cpu",
+                    compute_type=profile.compute_type,
+                    cpu_threads=profile.cpu_threads,
+                    num_workers=profile.num_workers,
+                )
+            return self._models[key]
+
+    def transcribe_file(
+            self,
+            file_path: str,
+            language: Optional[str] = None,
+            profile: Optional[DecodingProfile] = None,
+    ) -> str:
         """
         Transcribe an audio file and return plain text. Word-level timestamps are intentionally omitted.
         """
+        text, _ = self.transcribe_file_with_duration(file_path, language=language, profile=profile)
+        return text
+
+    def transcribe_file_with_duration(
+            self,
+            file_path: str,
+            language: Optional[str] = None,
+            profile: Optional[DecodingProfile] = None,
+    ) -> Tuple[str, float]:
+        """
+        Same as transcribe_file, but also return the audio duration in seconds as seen by the decoder.
+        """
+        profile = profile or DecodingProfile()
         kind, model = self._backend
 
         if kind == "faster":
-            segments, info = model.transcribe(file_path, language=language, vad_filter=True)
+            segments, info = self._faster_model(profile).transcribe(
+                file_path,
+                language=language,
+                beam_size=profile.beam_size,
+                temperature=profile.temperature,
+                vad_filter=profile.vad_filter,
+                vad_parameters=profile.vad_parameters,
+            )
             text = "".join(seg.text for seg in segments)
-            return text.strip()
+            return text.strip(), float(info.duration)
 
-        # openai-whisper fallback
+        # openai-whisper fallback (compute_type / threads / VAD are faster-whisper only)
         import whisper  # type: ignore
         # Disable verbose options to keep it simple and fast
-        result = model.transcribe(file_path, language=language, fp16=False, verbose=False)
+        result = model.transcribe(
+            file_path,
+            language=language,
+            fp16=False,
+            verbose=False,
+            beam_size=profile.beam_size if profile.beam_size > 1 else None,
+            temperature=tuple(profile.temperature),
+        )
         text = result.get("text", "")
-        return text.strip()
+        # No duration in the result; the end of the last segment is the closest approximation
+        segments = result.get("segments") or []
+        duration = float(segments[-1]["end"]) if segments else 0.0
+        return text.strip(), duration